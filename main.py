@@ -14,11 +14,13 @@ Configuration via environment variables:
 - TARGET_COLUMN (clean transcript) (default B)
 - RAW_TRANSCRIPT_COLUMN (default C)
 - DIAG_COLUMN (optional)
+- METADATA_COLUMN (optional; video metadata as JSON, needs YT_API_KEY)
 - HEADER_ROWS (default 1)
 - INDIAN_LANG_CODES (comma-separated, default: en,hi,bn,te,mr,ta,gu,kn,ml,pa,or,as,ur)
 - MAX_CHARS (default 30000)
 - SLEEP_BETWEEN_CALLS (float, default 0.5)
 - CHUNK_UPDATE_SIZE (int, default 800) -> how many cells per update batch
+- MAX_WORKERS (int, default 8) -> concurrent rows being fetched
 """
 
 import os
@@ -28,9 +30,28 @@ import json
 import glob
 import html
 import shlex
+import tempfile
+import atexit
+import math
+import hashlib
 import logging
+import functools
+import threading
 import subprocess
-from typing import List, Optional, Tuple, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Dict, Any, Callable
+
+from sheet_rows import pending_rows, process_rows_parallel, read_sheet_columns, write_rows
+from transcript_text import (
+    filter_vtt_lines,
+    parse_iso8601_duration,
+    punct_word_windows,
+    split_with_context,
+    tag_words,
+    tidy_punctuation_spacing,
+    trim_context,
+    video_id_from_url,
+)
 
 # Third-party imports (installed via requirements.txt)
 try:
@@ -51,36 +72,60 @@ PUNCT_MODEL = None
 SPACY_NLP = None
 PUNCT_AVAILABLE = False
 SPACY_AVAILABLE = False
-try:
-    from deepmultilingualpunctuation import PunctuationModel
+# model objects are shared across worker threads; inference is serialized per model
+_PUNCT_LOCK = threading.Lock()
+_SPACY_LOCK = threading.Lock()
+_models_ready = threading.Event()
+
 
+def _load_nlp_models() -> None:
+    """Populate PUNCT_MODEL / SPACY_NLP; runs in a background thread so loading overlaps sheet I/O."""
+    global PUNCT_MODEL, SPACY_NLP, PUNCT_AVAILABLE, SPACY_AVAILABLE
     try:
-        PUNCT_MODEL = PunctuationModel()
-        PUNCT_AVAILABLE = True
-        logging.info("PunctuationModel loaded.")
-    except Exception as e:
-        logging.warning("PunctuationModel failed to load: %s", e)
-except Exception:
-    logging.info("deepmultilingualpunctuation not installed; punctuation restoration disabled.")
+        try:
+            from deepmultilingualpunctuation import PunctuationModel
 
+            try:
+                PUNCT_MODEL = PunctuationModel()
+                PUNCT_AVAILABLE = True
+                logging.info("PunctuationModel loaded.")
+            except Exception as e:
+                logging.warning("PunctuationModel failed to load: %s", e)
+        except Exception:
+            logging.info("deepmultilingualpunctuation not installed; punctuation restoration disabled.")
+
+        try:
+            import spacy
+
+            try:
+                # Only sentence boundaries are needed; the rule-based sentencizer is far cheaper than the parser
+                SPACY_NLP = spacy.load(
+                    "en_core_web_sm",
+                    disable=["tok2vec", "tagger", "parser", "ner", "lemmatizer", "attribute_ruler"],
+                )
+                if "senter" not in SPACY_NLP.pipe_names and "sentencizer" not in SPACY_NLP.pipe_names:
+                    SPACY_NLP.add_pipe("sentencizer")
+                SPACY_AVAILABLE = True
+                logging.info("spaCy loaded.")
+            except Exception as e:
+                logging.warning("spaCy load failed: %s", e)
+        except Exception:
+            logging.info("spaCy not available.")
+    finally:
+        _models_ready.set()
+
+
+threading.Thread(target=_load_nlp_models, name="nlp-model-loader", daemon=True).start()
+
+
+# yt-dlp as a library keeps its HTTP session and extractor state warm; the CLI is the fallback
+YT_DLP_LIB_AVAILABLE = False
 try:
-    import spacy
+    import yt_dlp
 
-    try:
-        SPACY_NLP = spacy.load("en_core_web_sm")
-        SPACY_AVAILABLE = True
-        # Optionally disable heavy pipes for speed
-        for pipe in list(SPACY_NLP.pipe_names):
-            if pipe not in ("senter", "sentencizer", "parser", "tagger"):
-                try:
-                    SPACY_NLP.disable_pipe(pipe)
-                except Exception:
-                    pass
-        logging.info("spaCy loaded.")
-    except Exception as e:
-        logging.warning("spaCy load failed: %s", e)
+    YT_DLP_LIB_AVAILABLE = True
 except Exception:
-    logging.info("spaCy not available.")
+    logging.info("yt_dlp module not importable; falling back to the yt-dlp CLI.")
 
 
 # -------------------------
@@ -103,11 +148,16 @@ SOURCE_COLUMN = getenv("SOURCE_COLUMN", "A")
 TARGET_COLUMN = getenv("TARGET_COLUMN", "B")
 RAW_TRANSCRIPT_COLUMN = getenv("RAW_TRANSCRIPT_COLUMN", "C")
 DIAG_COLUMN = getenv("DIAG_COLUMN")  # optional
+METADATA_COLUMN = getenv("METADATA_COLUMN")  # optional; metadata is only fetched when set
 HEADER_ROWS = int(getenv("HEADER_ROWS", "1"))
 INDIAN_LANG_CODES = getenv("INDIAN_LANG_CODES", "en,hi,bn,te,mr,ta,gu,kn,ml,pa,or,as,ur").split(",")
 MAX_CHARS = int(getenv("MAX_CHARS", "30000"))
 SLEEP_BETWEEN_CALLS = float(getenv("SLEEP_BETWEEN_CALLS", "0.5"))
 CHUNK_UPDATE_SIZE = int(getenv("CHUNK_UPDATE_SIZE", "800"))
+MAX_WORKERS = int(getenv("MAX_WORKERS", "8"))
+
+# 1-based indices of the output columns (the keys of write_rows' row dicts), parsed from A1 once
+COL_INDICES = {col: a1_to_rowcol(f"{col}1")[1] for col in (TARGET_COLUMN, RAW_TRANSCRIPT_COLUMN, DIAG_COLUMN, METADATA_COLUMN) if col}
 
 YT_DLP_OUTDIR = getenv("YT_DLP_OUTDIR", "/tmp/yt_dlp_subs")
 os.makedirs(YT_DLP_OUTDIR, exist_ok=True)
@@ -140,20 +190,19 @@ def _ensure_text(x: Any) -> str:
     return str(x)
 
 
+def _segment_text(s: Any) -> str:
+    # dicts (older youtube_transcript_api) and FetchedTranscriptSnippet (.text) are the hot path
+    t = s.get("text", "") if isinstance(s, dict) else getattr(s, "text", s)
+    if not isinstance(t, str):
+        t = _ensure_text(t)
+    return t.strip()
+
+
 def safe_join_segments(segs: List[Any]) -> str:
-    """Robustly join segments that may be dicts, strings, lists."""
+    """Robustly join segments that may be dicts, snippet objects, strings, lists."""
     if not segs:
         return ""
-    parts = []
-    for s in segs:
-        if isinstance(s, dict):
-            t = s.get("text", "")
-        else:
-            t = s
-        t = _ensure_text(t).strip()
-        if t:
-            parts.append(t.replace("\n", " "))
-    return " ".join(parts)
+    return " ".join(t.replace("\n", " ") for t in map(_segment_text, segs) if t)
 
 
 def chunked(iterable: List[Any], size: int):
@@ -162,20 +211,107 @@ def chunked(iterable: List[Any], size: int):
         yield iterable[i : i + size]
 
 
+def text_digest_cache(maxsize: int = 1024):
+    """
+    LRU cache for str -> str functions, keyed by a blake2b digest of the input
+    so that long transcripts are not kept alive as dict keys.
+    """
+
+    def decorator(func):
+        cache: "OrderedDict[bytes, str]" = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0}
+
+        def _key(text: str) -> bytes:
+            return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+        def cache_get(text: str) -> Optional[str]:
+            key = _key(text)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    return cache[key]
+                stats["misses"] += 1
+            return None
+
+        def cache_put(text: str, result: str) -> None:
+            key = _key(text)
+            with lock:
+                cache[key] = result
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        @functools.wraps(func)
+        def wrapper(text: str) -> str:
+            result = cache_get(text)
+            if result is None:
+                result = func(text)
+                cache_put(text, result)
+            return result
+
+        def cache_info() -> Dict[str, int]:
+            with lock:
+                return {"hits": stats["hits"], "misses": stats["misses"], "maxsize": maxsize, "currsize": len(cache)}
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats["hits"] = stats["misses"] = 0
+
+        wrapper.cache_get = cache_get
+        wrapper.cache_put = cache_put
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _batch_through_cache(
+    cached: Callable[[str], str], texts: List[str], compute: Callable[[List[str]], List[str]]
+) -> List[str]:
+    """
+    Serve texts from the text_digest_cache of `cached`; the distinct misses are
+    computed in one compute() call and stored, so batched and per-text calls share the cache.
+    """
+    results: List[Optional[str]] = [cached.cache_get(t) for t in texts]
+    misses = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+    if not misses:
+        return results
+    computed = dict(zip(misses, compute(misses)))
+    for t, r in computed.items():
+        cached.cache_put(t, r)
+    return [computed[t] if r is None else r for t, r in zip(texts, results)]
+
+
 # -------------------------
 # NLP cleaning pipeline
 # -------------------------
 _SENTENCE_END = re.compile(r"[.!?]$")
+_RE_WEBVTT = re.compile(r"^\s*WEBVTT[^\n]*\n", re.IGNORECASE)
+_RE_TS_HMS = re.compile(r"\d{1,2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{1,2}:\d{2}:\d{2}\.\d{3}")
+_RE_TS_MS = re.compile(r"\d{1,2}:\d{2}\.\d{3}\s*-->\s*\d{1,2}:\d{2}\.\d{3}")
+_RE_WS = re.compile(r"\s+")
+_RE_SENT_SPLIT = re.compile(r"(?<=[\.\?\!])\s+")
 
 
 def _strip_vtt_srt_artifacts(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r"^\s*WEBVTT[^\n]*\n", "", text, flags=re.IGNORECASE)
+    # cheap literal checks first; regex only where the pattern is genuinely needed
+    if "WEBVTT" in text[:64].upper():
+        text = _RE_WEBVTT.sub("", text)
     # remove common timestamp patterns
-    text = re.sub(r"\d{1,2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{1,2}:\d{2}:\d{2}\.\d{3}", " ", text)
-    text = re.sub(r"\d{1,2}:\d{2}\.\d{3}\s*-->\s*\d{1,2}:\d{2}\.\d{3}", " ", text)
-    text = re.sub(r"^\s*\d+\s*$", "", text, flags=re.MULTILINE)
+    if "-->" in text:
+        text = _RE_TS_HMS.sub(" ", text)
+        text = _RE_TS_MS.sub(" ", text)
+    # blank out cue-number-only lines
+    if "\n" in text:
+        text = "\n".join("" if ln.strip().isdigit() else ln for ln in text.split("\n"))
+    elif text.strip().isdigit():
+        text = ""
     text = html.unescape(text)
     return text
 
@@ -185,66 +321,160 @@ def _join_segments_for_nlp(segments: List[dict]) -> str:
     for seg in segments:
         if not seg:
             continue
-        t = seg.get("text") if isinstance(seg, dict) else str(seg)
+        t = seg.get("text") if isinstance(seg, dict) else str(getattr(seg, "text", seg))
         if t:
             t = t.replace("\n", " ").strip()
             parts.append(t)
     return " ".join(parts)
 
 
+# ~2000 chars per model call; the context words on each side are for the model only and trimmed afterwards
+PUNCT_CHUNK_WORDS = 350
+PUNCT_CONTEXT_WORDS = 10
+PUNCT_BATCH_SIZE = 16
+
+
+def _punct_chunks(raw_text: str) -> List[Tuple[str, int, int]]:
+    return split_with_context(raw_text, PUNCT_CHUNK_WORDS, PUNCT_CONTEXT_WORDS)
+
+
+@text_digest_cache(maxsize=1024)
 def restore_punctuation_and_case(raw_text: str) -> str:
     """Use punctuation model if available; otherwise return raw_text."""
     if not raw_text:
         return ""
+    _models_ready.wait()
     if not PUNCT_AVAILABLE:
         return raw_text
-    # chunk to avoid OOM / long processing
-    max_chunk = 2000
-    overlap = 50
-    chunks = []
-    i = 0
-    n = len(raw_text)
-    while i < n:
-        end = min(i + max_chunk, n)
-        chunk = raw_text[i:end]
-        # add overlap for context
-        if i != 0:
-            start = max(0, i - overlap)
-            chunk = raw_text[start:end]
-        if end < n:
-            chunk = raw_text[i : end + overlap]
-        chunks.append(chunk)
-        i = end
     restored_chunks = []
-    for c in chunks:
+    for piece, lead, core in _punct_chunks(raw_text):
         try:
-            out = PUNCT_MODEL.restore_punctuation(c)
-            restored_chunks.append(out)
+            with _PUNCT_LOCK:
+                out = PUNCT_MODEL.restore_punctuation(piece)
         except Exception as e:
             logger.debug("punctuator chunk failed: %s", e)
-            restored_chunks.append(c)
+            out = piece
+        restored_chunks.append(trim_context(piece, out, lead, core))
     restored = " ".join(restored_chunks)
-    restored = re.sub(r"\s+", " ", restored).strip()
+    restored = _RE_WS.sub(" ", restored).strip()
     return restored
 
 
+def _punct_chunks_batched(chunks: List[str]) -> List[str]:
+    """Run the punctuation token-classifier over all chunks with batched forward passes."""
+    model = PUNCT_MODEL
+    per_chunk_windows = [punct_word_windows(model.preprocess(c)) for c in chunks]
+    flat = [(ci, words, keep) for ci, wins in enumerate(per_chunk_windows) for words, keep in wins]
+    if not flat:
+        return ["" for _ in chunks]
+    with _PUNCT_LOCK:
+        results = model.pipe([" ".join(words) for _, words, _ in flat], batch_size=PUNCT_BATCH_SIZE)
+    tagged: List[List[Tuple[str, str]]] = [[] for _ in chunks]
+    for (ci, words, keep), entities in zip(flat, results):
+        tagged[ci].extend(tag_words(words, keep, entities))
+    return [model.prediction_to_text([(w, label, None) for w, label in t]) for t in tagged]
+
+
+def restore_punctuation_batch(texts: List[str]) -> List[str]:
+    """
+    Batched variant of restore_punctuation_and_case: texts not in its cache are
+    chunked, the chunks from all of them are sent through the model pipeline
+    together, then reassembled per text. Falls back to per-text calls if the
+    model does not expose the expected internals.
+    """
+    return _batch_through_cache(restore_punctuation_and_case, texts, _restore_punctuation_batch_uncached)
+
+
+def _restore_punctuation_batch_uncached(texts: List[str]) -> List[str]:
+    per_text = restore_punctuation_and_case.__wrapped__
+    _models_ready.wait()
+    if not PUNCT_AVAILABLE:
+        return list(texts)
+    if not all(hasattr(PUNCT_MODEL, a) for a in ("pipe", "preprocess", "prediction_to_text")):
+        return [per_text(t) for t in texts]
+    owners: List[int] = []
+    chunks: List[Tuple[str, int, int]] = []
+    for idx, t in enumerate(texts):
+        if not t:
+            continue
+        for chunk in _punct_chunks(t):
+            owners.append(idx)
+            chunks.append(chunk)
+    try:
+        restored_chunks = _punct_chunks_batched([piece for piece, _, _ in chunks])
+    except Exception as e:
+        logger.debug("batched punctuation failed, falling back to per-text: %s", e)
+        return [per_text(t) for t in texts]
+    grouped: List[List[str]] = [[] for _ in texts]
+    for idx, (piece, lead, core), out in zip(owners, chunks, restored_chunks):
+        grouped[idx].append(trim_context(piece, out, lead, core))
+    return [_RE_WS.sub(" ", " ".join(g)).strip() for g in grouped]
+
+
+def _capitalize_first_alnum(s: str) -> str:
+    """Uppercase the first ASCII letter/digit; untouched if it is already upper-case or a digit."""
+    for i, ch in enumerate(s):
+        if ch.isascii() and ch.isalnum():
+            if ch.islower():
+                return s[:i] + ch.upper() + s[i + 1 :]
+            return s
+    return s
+
+
+def _capitalize_sentences(sents: List[str]) -> str:
+    return " ".join(_capitalize_first_alnum(s) for s in sents)
+
+
+@text_digest_cache(maxsize=1024)
 def sentence_segment_and_capitalize(text: str) -> str:
     if not text:
         return ""
+    _models_ready.wait()
     if SPACY_AVAILABLE and SPACY_NLP:
-        doc = SPACY_NLP(text)
+        with _SPACY_LOCK:
+            doc = SPACY_NLP(text)
         sents = [s.text.strip() for s in doc.sents if s.text.strip()]
     else:
-        sents = re.split(r"(?<=[\.\?\!])\s+", text)
+        sents = _RE_SENT_SPLIT.split(text)
         sents = [s.strip() for s in sents if s.strip()]
-    cap_sents = []
-    for s in sents:
-        idx = re.search(r"[A-Za-z0-9]", s)
-        if idx:
-            i = idx.start()
-            s = s[:i] + s[i].upper() + s[i + 1 :]
-        cap_sents.append(s)
-    return " ".join(cap_sents)
+    return _capitalize_sentences(sents)
+
+
+def sentence_segment_and_capitalize_batch(texts: List[str], batch_size: int = 32) -> List[str]:
+    """Batched variant of sentence_segment_and_capitalize using nlp.pipe; shares its cache."""
+    return _batch_through_cache(
+        sentence_segment_and_capitalize, texts, lambda misses: _sentence_segment_batch_uncached(misses, batch_size)
+    )
+
+
+def _sentence_segment_batch_uncached(texts: List[str], batch_size: int) -> List[str]:
+    _models_ready.wait()
+    if not (SPACY_AVAILABLE and SPACY_NLP):
+        return [sentence_segment_and_capitalize.__wrapped__(t) for t in texts]
+    results = [""] * len(texts)
+    todo = [i for i, t in enumerate(texts) if t]
+    with _SPACY_LOCK:
+        docs = list(SPACY_NLP.pipe((texts[i] for i in todo), batch_size=batch_size))
+    for i, doc in zip(todo, docs):
+        sents = [s.text.strip() for s in doc.sents if s.text.strip()]
+        results[i] = _capitalize_sentences(sents)
+    return results
+
+
+def _prepare_raw_for_nlp(source: Any) -> str:
+    if isinstance(source, list):
+        raw = _join_segments_for_nlp(source)
+    else:
+        raw = _ensure_text(source)
+    raw = _strip_vtt_srt_artifacts(raw)
+    return _RE_WS.sub(" ", raw).strip()
+
+
+def _restore_punctuation_safe(raw: str) -> str:
+    try:
+        return restore_punctuation_and_case(raw)
+    except Exception:
+        return raw
 
 
 def clean_transcript_nlp(source: Any) -> str:
@@ -255,39 +485,106 @@ def clean_transcript_nlp(source: Any) -> str:
       - restores punctuation (if model available)
       - sentence segmentation and capitalization via spaCy
     """
-    if isinstance(source, list):
-        raw = _join_segments_for_nlp(source)
-    else:
-        raw = _ensure_text(source)
-    raw = _strip_vtt_srt_artifacts(raw)
-    raw = re.sub(r"\s+", " ", raw).strip()
-    try:
-        puncted = restore_punctuation_and_case(raw)
-    except Exception:
-        puncted = raw
+    raw = _prepare_raw_for_nlp(source)
+    puncted = _restore_punctuation_safe(raw)
     final = sentence_segment_and_capitalize(puncted)
-    final = re.sub(r"\s+([,.;:!?])", r"\1", final)
-    final = re.sub(r"([,.;:!?])([^\s])", r"\1 \2", final)
-    final = re.sub(r"\s+", " ", final).strip()
-    return final
+    return tidy_punctuation_spacing(final)
+
+
+def clean_transcripts_nlp_batch(sources: List[Any]) -> List[str]:
+    """Same as clean_transcript_nlp over many sources; spaCy runs batched via nlp.pipe."""
+    puncted = restore_punctuation_batch([_prepare_raw_for_nlp(src) for src in sources])
+    return [tidy_punctuation_spacing(t) for t in sentence_segment_and_capitalize_batch(puncted)]
+
+
+def _log_nlp_cache_stats() -> None:
+    logger.info("restore_punctuation_and_case cache: %s", restore_punctuation_and_case.cache_info())
+    logger.info("sentence_segment_and_capitalize cache: %s", sentence_segment_and_capitalize.cache_info())
+
+
+atexit.register(_log_nlp_cache_stats)
 
 
 # -------------------------
-# yt-dlp helper (subprocess)
+# yt-dlp helper (in-process, subprocess fallback)
 # -------------------------
-def yt_dlp_fetch_subtitles(
+class _YdlDiagLogger:
+    """Collects yt-dlp log output so it can be returned as diagnostics."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def debug(self, msg: str) -> None:
+        self.lines.append(msg)
+
+    info = warning = error = debug
+
+
+# one YoutubeDL per option set, shared across rows and worker threads
+_YDL_INSTANCES: Dict[Tuple[Any, ...], Tuple[Any, _YdlDiagLogger]] = {}
+# YoutubeDL is not documented as thread-safe; downloads are serialized, one video per hold
+_YDL_LOCK = threading.Lock()
+
+
+def _get_ydl(
+    lang: str, use_auto: bool, cookies_file: Optional[str], proxy: Optional[str], out_dir: str, timeout: int
+) -> Tuple[Any, _YdlDiagLogger]:
+    key = (lang, use_auto, cookies_file, proxy, out_dir, timeout)
+    if key not in _YDL_INSTANCES:
+        diag_logger = _YdlDiagLogger()
+        opts: Dict[str, Any] = {
+            "skip_download": True,
+            "writeautomaticsub" if use_auto else "writesubtitles": True,
+            "subtitleslangs": [lang],
+            "outtmpl": f"{out_dir}/%(id)s.%(ext)s",
+            "socket_timeout": timeout,
+            "quiet": True,
+            "logger": diag_logger,
+        }
+        if cookies_file:
+            opts["cookiefile"] = cookies_file
+        if proxy:
+            opts["proxy"] = proxy
+        _YDL_INSTANCES[key] = (yt_dlp.YoutubeDL(opts), diag_logger)
+    return _YDL_INSTANCES[key]
+
+
+def _run_yt_dlp_inprocess(
     video_url: str,
-    lang: str = "en",
-    use_auto: bool = True,
-    cookies_file: Optional[str] = None,
-    proxy: Optional[str] = None,
-    out_dir: str = YT_DLP_OUTDIR,
-    timeout: int = 120,
-) -> Tuple[Optional[str], str]:
+    lang: str,
+    use_auto: bool,
+    cookies_file: Optional[str],
+    proxy: Optional[str],
+    out_dir: str,
+    timeout: int,
+) -> Optional[str]:
     """
-    Returns (subtitle_text or None, diagnostics stdout+stderr)
+    Download one video's subtitles through the shared YoutubeDL; returns diagnostics.
+    Returns None if _YDL_LOCK could not be taken within `timeout` seconds (e.g. another
+    extraction is stalled), so the caller can use the CLI, which has a wall-clock limit.
     """
-    os.makedirs(out_dir, exist_ok=True)
+    if not _YDL_LOCK.acquire(timeout=timeout):
+        return None
+    try:
+        try:
+            ydl, diag_logger = _get_ydl(lang, use_auto, cookies_file, proxy, out_dir, timeout)
+        except Exception as e:
+            return f"yt-dlp-init-exception:{e}"
+        diag_logger.lines = []
+        try:
+            ydl.extract_info(video_url, download=True)
+        except yt_dlp.utils.DownloadError:
+            pass  # already reported through diag_logger.error
+        except Exception as e:
+            diag_logger.lines.append(f"yt-dlp-error:{e}")
+        return "\n".join(diag_logger.lines)
+    finally:
+        _YDL_LOCK.release()
+
+
+def _yt_dlp_sub_flags(
+    lang: str, use_auto: bool, cookies_file: Optional[str], proxy: Optional[str], out_dir: str
+) -> List[str]:
     sub_flags = ["--skip-download", "--output", f"{out_dir}/%(id)s.%(ext)s"]
     if use_auto:
         sub_flags += ["--write-auto-sub"]
@@ -298,28 +595,23 @@ def yt_dlp_fetch_subtitles(
         sub_flags += ["--cookies", cookies_file]
     if proxy:
         sub_flags += ["--proxy", proxy]
-    # quiet but capture output
-    cmd = ["yt-dlp"] + sub_flags + [video_url]
+    return sub_flags
+
+
+def _run_yt_dlp(cmd: List[str], timeout: int) -> Tuple[bool, str]:
+    """Returns (ran, diagnostics stdout+stderr or exception note)."""
     try:
         logger.debug("Running yt-dlp: %s", shlex.join(cmd))
     except Exception:
         logger.debug("Running yt-dlp: %s", " ".join(cmd))
     try:
         proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
-        diag = proc.stdout + "\n" + proc.stderr
+        return True, proc.stdout + "\n" + proc.stderr
     except Exception as e:
-        return None, f"yt-dlp-run-exception:{e}"
-    # determine id
-    vid = None
-    if "watch?v=" in video_url:
-        vid = video_url.split("watch?v=")[-1].split("&")[0]
-    else:
-        vid = video_url.rstrip("/").split("/")[-1]
-    candidates = []
-    if vid:
-        candidates = glob.glob(os.path.join(out_dir, f"{vid}.*"))
-    if not candidates:
-        candidates = sorted(glob.glob(os.path.join(out_dir, "*.*")), key=os.path.getmtime, reverse=True)[:6]
+        return False, f"yt-dlp-run-exception:{e}"
+
+
+def _read_subtitle_candidates(candidates: List[str]) -> Optional[str]:
     txt = None
     for c in candidates:
         if c.lower().endswith((".vtt", ".srt", ".txt", ".webvtt")):
@@ -328,23 +620,229 @@ def yt_dlp_fetch_subtitles(
                     content = f.read()
             except Exception:
                 continue
+            # keep out_dir bounded by in-flight rows rather than every row ever processed
+            try:
+                os.unlink(c)
+            except OSError:
+                pass
             if c.lower().endswith(".vtt") or content.strip().upper().startswith("WEBVTT"):
-                lines = []
-                for line in content.splitlines():
-                    if line.strip().upper().startswith("WEBVTT"):
-                        continue
-                    if "-->" in line:
-                        continue
-                    if line.strip().isdigit():
-                        continue
-                    lines.append(line)
-                txt = "\n".join(lines).strip()
+                txt = filter_vtt_lines(content)
             else:
                 txt = content.strip()
             if txt:
                 txt = html.unescape(txt)
                 break
-    return txt, diag
+    return txt
+
+
+def yt_dlp_fetch_subtitles(
+    video_url: str,
+    lang: str = "en",
+    use_auto: bool = True,
+    cookies_file: Optional[str] = None,
+    proxy: Optional[str] = None,
+    out_dir: str = YT_DLP_OUTDIR,
+    timeout: int = 120,
+) -> Tuple[Optional[str], str]:
+    """
+    Returns (subtitle_text or None, diagnostics stdout+stderr)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    diag = None
+    if YT_DLP_LIB_AVAILABLE:
+        diag = _run_yt_dlp_inprocess(video_url, lang, use_auto, cookies_file, proxy, out_dir, timeout)
+        if diag is None:
+            logger.debug("shared yt-dlp busy for %ss; using the CLI for %s", timeout, video_url)
+    if diag is None:
+        # quiet but capture output
+        cmd = ["yt-dlp"] + _yt_dlp_sub_flags(lang, use_auto, cookies_file, proxy, out_dir) + [video_url]
+        ran, diag = _run_yt_dlp(cmd, timeout)
+        if not ran:
+            return None, diag
+    vid = video_id_from_url(video_url)
+    if not vid:
+        return None, diag
+    # only this video's files: with concurrent fetches, "newest file in out_dir" may belong to another video
+    return _read_subtitle_candidates(glob.glob(os.path.join(glob.escape(out_dir), f"{glob.escape(vid)}.*"))), diag
+
+
+def _run_yt_dlp_batch_file(
+    video_urls: List[str],
+    lang: str,
+    use_auto: bool,
+    cookies_file: Optional[str],
+    proxy: Optional[str],
+    out_dir: str,
+    timeout: int,
+) -> Tuple[bool, str]:
+    # outside out_dir, where .txt files are treated as subtitles
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", prefix="yt-dlp-batch-", delete=False) as f:
+        f.write("\n".join(video_urls) + "\n")
+        batch_path = f.name
+    cmd = ["yt-dlp"] + _yt_dlp_sub_flags(lang, use_auto, cookies_file, proxy, out_dir)
+    if SLEEP_BETWEEN_CALLS > 0:
+        cmd += ["--sleep-subtitles", str(math.ceil(SLEEP_BETWEEN_CALLS))]
+    cmd += ["--batch-file", batch_path]
+    try:
+        return _run_yt_dlp(cmd, timeout * len(video_urls))
+    finally:
+        try:
+            os.unlink(batch_path)
+        except OSError:
+            pass
+
+
+def yt_dlp_fetch_subtitles_batch(
+    video_urls: List[str],
+    lang: str = "en",
+    use_auto: bool = True,
+    cookies_file: Optional[str] = None,
+    proxy: Optional[str] = None,
+    out_dir: str = YT_DLP_OUTDIR,
+    timeout: int = 120,
+) -> Dict[str, Tuple[Optional[str], str]]:
+    """
+    Fetch subtitles for many videos through one shared YoutubeDL instance, or a
+    single yt-dlp process (--batch-file) for videos where the module is not
+    importable or the shared instance stays busy, so start-up and the HTTP
+    connection pool are shared.
+    Returns {video_id: (subtitle_text or None, diagnostics)}; in-process videos
+    get their own diagnostics, the --batch-file run's output goes only to the
+    videos that were sent to it.
+    """
+    if not video_urls:
+        return {}
+    os.makedirs(out_dir, exist_ok=True)
+    diags: Dict[str, str] = {}
+    leftover = list(video_urls)
+    if YT_DLP_LIB_AVAILABLE:
+        leftover = []
+        for n, url in enumerate(video_urls):
+            if n and SLEEP_BETWEEN_CALLS > 0:
+                time.sleep(SLEEP_BETWEEN_CALLS)
+            d = _run_yt_dlp_inprocess(url, lang, use_auto, cookies_file, proxy, out_dir, timeout)
+            if d is None:
+                leftover.append(url)
+            else:
+                diags[url] = d
+    if leftover:
+        # shared instance unavailable or busy: one CLI process for the rest
+        _, d = _run_yt_dlp_batch_file(leftover, lang, use_auto, cookies_file, proxy, out_dir, timeout)
+        for url in leftover:
+            diags[url] = d
+    results: Dict[str, Tuple[Optional[str], str]] = {}
+    for url in video_urls:
+        vid = video_id_from_url(url)
+        if not vid:
+            continue
+        pattern = os.path.join(glob.escape(out_dir), f"{glob.escape(vid)}.*")
+        results[vid] = (_read_subtitle_candidates(glob.glob(pattern)), diags.get(url, ""))
+    return results
+
+
+# -------------------------
+# Per-video fetch + clean (memoized)
+# -------------------------
+def _fetch_transcript_segments(vid: str) -> List[Any]:
+    # youtube_transcript_api >= 1.0 uses an instance .fetch(); older releases a classmethod
+    if hasattr(YouTubeTranscriptApi, "fetch"):
+        return list(YouTubeTranscriptApi().fetch(vid, languages=INDIAN_LANG_CODES))
+    return YouTubeTranscriptApi.get_transcript(vid, languages=INDIAN_LANG_CODES)
+
+
+_FETCH_CACHE_SIZE = 4096
+_FETCH_CACHE: Dict[str, Tuple[str, Dict[str, Any], str]] = {}
+_FETCH_CACHE_LOCK = threading.Lock()
+
+
+def fetch_video(vid: str) -> Tuple[str, Dict[str, Any], str]:
+    """
+    Network part for one video: transcript via the API (may be empty) + metadata
+    (only when METADATA_COLUMN is set; {} otherwise).
+    Returns (raw_transcript, metadata, diagnostics). Memoized per video id, so
+    duplicate URLs in the sheet cost one fetch; treat the result as read-only.
+    Results of unexpected API errors are not memoized, they may be transient.
+    """
+    with _FETCH_CACHE_LOCK:
+        if vid in _FETCH_CACHE:
+            return _FETCH_CACHE[vid]
+    diag = ""
+    raw = ""
+    try:
+        raw = safe_join_segments(_fetch_transcript_segments(vid))
+    except (NoTranscriptFound, TranscriptsDisabled, CouldNotRetrieveTranscript) as e:
+        diag = f"transcript-api:{type(e).__name__}"
+    except Exception as e:
+        diag = f"transcript-api-exception:{e}"
+    result = (raw, fetch_video_metadata(vid) if METADATA_COLUMN else {}, diag)
+    if not diag.startswith("transcript-api-exception:"):
+        with _FETCH_CACHE_LOCK:
+            if len(_FETCH_CACHE) >= _FETCH_CACHE_SIZE:
+                _FETCH_CACHE.pop(next(iter(_FETCH_CACHE)))
+            _FETCH_CACHE[vid] = result
+    return result
+
+
+def fetch_and_clean_videos(
+    fetched: Dict[str, Tuple[str, Dict[str, Any], str]]
+) -> Dict[str, Tuple[str, str, Dict[str, Any], str]]:
+    """
+    Finish the fetch_video results: one yt-dlp batch for the videos the API had
+    no transcript for, then a single batched NLP pass over all transcripts.
+    Returns {vid: (raw_transcript, clean_transcript, metadata, diagnostics)}.
+    """
+    raws = {vid: raw for vid, (raw, _, _) in fetched.items()}
+    diags = {vid: diag for vid, (_, _, diag) in fetched.items()}
+    missing = [vid for vid, raw in raws.items() if not raw]
+    if missing:
+        subs = yt_dlp_fetch_subtitles_batch(
+            [f"https://www.youtube.com/watch?v={vid}" for vid in missing], cookies_file=COOKIES_FILE, proxy=PROXY
+        )
+        for vid in missing:
+            txt, ydiag = subs.get(vid, (None, ""))
+            raws[vid] = txt or ""
+            if not txt:
+                diags[vid] = "\n".join(p for p in (diags[vid], ydiag.strip()) if p)
+    vids = list(raws)
+    cleaned = clean_transcripts_nlp_batch([raws[vid] for vid in vids])
+    return {
+        vid: (raws[vid][:MAX_CHARS], clean[:MAX_CHARS], fetched[vid][1], diags[vid][:MAX_CHARS])
+        for vid, clean in zip(vids, cleaned)
+    }
+
+
+# -------------------------
+# Rows
+# -------------------------
+def build_rows_out(todo: List[Tuple[int, str]]) -> Dict[int, Dict[str, str]]:
+    """
+    Produce {rownum: {column_letter: value}} for write_rows from (rownum, url) pairs:
+      1. fetch pass: fetch_video for the first row of each distinct video id, in parallel
+      2. yt-dlp batch + batched NLP clean over those videos (fetch_and_clean_videos)
+      3. every row, duplicates included, takes its video's result
+    """
+    row_vids = {rownum: video_id_from_url(url) for rownum, url in todo if (url or "").strip()}
+    first_rows: Dict[str, Tuple[int, str]] = {}
+    for rownum, url in todo:
+        vid = row_vids.get(rownum)
+        if vid:
+            first_rows.setdefault(vid, (rownum, url))
+    fetched_by_row = process_rows_parallel(
+        first_rows.values(), lambda rownum, url: fetch_video(row_vids[rownum]), MAX_WORKERS
+    )
+    results = fetch_and_clean_videos({row_vids[rownum]: res for rownum, res in fetched_by_row.items()})
+    rows_out: Dict[int, Dict[str, str]] = {}
+    for rownum, vid in row_vids.items():
+        if vid not in results:
+            continue
+        raw, clean, meta, diag = results[vid]
+        row = {TARGET_COLUMN: clean, RAW_TRANSCRIPT_COLUMN: raw}
+        if DIAG_COLUMN:
+            row[DIAG_COLUMN] = diag
+        if METADATA_COLUMN:
+            row[METADATA_COLUMN] = json.dumps(meta, ensure_ascii=False)
+        rows_out[rownum] = row
+    return rows_out
 
 
 # -------------------------
@@ -361,18 +859,6 @@ if YT_API_KEY:
         YOUTUBE_CLIENT = None
 
 
-def parse_iso8601_duration(iso_duration: str) -> str:
-    if not iso_duration:
-        return ""
-    m = re.match(r"^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$", iso_duration)
-    if not m:
-        return iso_duration
-    hours = int(m.group(1) or 0)
-    minutes = int(m.group(2) or 0)
-    seconds = int(m.group(3) or 0)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-
 def fetch_video_metadata(video_id: str) -> Dict[str, Any]:
     result: Dict[str, Any] = {
         "author": "",
@@ -395,4 +881,46 @@ def fetch_video_metadata(video_id: str) -> Dict[str, Any]:
         stats = item.get("statistics", {})
         result["author"] = snippet.get("channelTitle", "") or ""
         iso_dur = content.get("duration")
-        result["duration"] = pars
+        result["duration"] = parse_iso8601_duration(iso_dur) if iso_dur else ""
+        result["description"] = snippet.get("description", "") or ""
+        result["likes"] = stats.get("likeCount", "") or ""
+        result["comment_count"] = stats.get("commentCount", "") or ""
+    except Exception as e:
+        logger.debug("metadata fetch failed for %s: %s", video_id, e)
+        return result
+    if result["comment_count"] in ("", "0"):
+        return result
+    try:
+        resp = (
+            YOUTUBE_CLIENT.commentThreads()
+            .list(part="snippet", videoId=video_id, maxResults=1, order="relevance", textFormat="plainText")
+            .execute()
+        )
+        items = resp.get("items", [])
+        if items:
+            top = items[0].get("snippet", {}).get("topLevelComment", {}).get("snippet", {})
+            result["top_comment"] = top.get("textDisplay", "") or ""
+    except Exception as e:
+        # comments disabled / quota: keep the rest of the metadata
+        logger.debug("top comment fetch failed for %s: %s", video_id, e)
+    return result
+
+
+# -------------------------
+# Main
+# -------------------------
+def main() -> None:
+    creds = Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=["https://www.googleapis.com/auth/spreadsheets"]
+    )
+    sh = gspread.authorize(creds).open_by_key(SPREADSHEET_ID).sheet1
+    # source and target only: the target tells which rows are already done
+    todo = pending_rows(read_sheet_columns(sh, [SOURCE_COLUMN, TARGET_COLUMN]), HEADER_ROWS)
+    logger.info("%d rows to process.", len(todo))
+    if not todo:
+        return
+    write_rows(sh, build_rows_out(todo), COL_INDICES, CHUNK_UPDATE_SIZE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+sheet_rows.py
+
+Row plumbing used by main.py: reading source columns, running per-row work on a
+thread pool, and turning {rownum: {column_letter: value}} into chunked
+batch_update calls. Works on any object with gspread's batch_get/batch_update
+methods, so it can be tested without a sheet.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger("yt_transcript_worker")
+
+
+# -------------------------
+# Parallel row processing
+# -------------------------
+def process_rows_parallel(
+    todo: Iterable[Tuple[int, str]],
+    process_row: Callable[[int, str], Any],
+    max_workers: int = 8,
+) -> Dict[int, Any]:
+    """
+    Run process_row(rownum, url) for every (rownum, url) in todo on a thread pool
+    (the work is network-bound) and map rownum -> its result, in row order.
+    A failing row is logged and skipped so the rest of the batch still gets written.
+    """
+    results: Dict[int, Any] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(process_row, rownum, url): rownum for rownum, url in todo}
+        for fut in as_completed(futures):
+            rownum = futures[fut]
+            try:
+                results[rownum] = fut.result()
+            except Exception as e:
+                logger.warning("Row %d failed: %s", rownum, e)
+    return {rownum: results[rownum] for rownum in sorted(results)}
+
+
+# -------------------------
+# Google Sheets I/O
+# -------------------------
+def read_sheet_columns(sh, columns: List[str]) -> List[List[str]]:
+    """
+    Fetch only the given columns (e.g. ["A", "B"]) in one batch_get round-trip.
+    Returns one flat list of cell values per column, padded to equal length.
+    """
+    ranges = [f"{col}1:{col}" for col in columns]
+    value_ranges = sh.batch_get(ranges)
+    cols = [[row[0] if row else "" for row in vr] for vr in value_ranges]
+    height = max((len(c) for c in cols), default=0)
+    return [c + [""] * (height - len(c)) for c in cols]
+
+
+def pending_rows(columns: List[List[str]], header_rows: int) -> List[Tuple[int, str]]:
+    """
+    (rownum, url) for the data rows still to do: a source URL and an empty target.
+    columns is read_sheet_columns(sh, [source, target]) output; rownum is 1-based.
+    """
+    src, trg = columns[0][header_rows:], columns[1][header_rows:]
+    return [
+        (rownum, url.strip())
+        for rownum, (url, done) in enumerate(zip(src, trg), start=header_rows + 1)
+        if url.strip() and not done.strip()
+    ]
+
+
+def build_batch_update_body(rows_out: Dict[int, Dict[str, str]], col_indices: Dict[str, int]) -> List[Dict[str, Any]]:
+    """
+    Turn {rownum: {column_letter: value}} into batch_update entries. col_indices maps
+    each column letter to its 1-based index. Adjacent columns within a row are
+    coalesced into one range, e.g. B5:C5 -> [[b, c]].
+    """
+    body: List[Dict[str, Any]] = []
+    for rownum, cols in rows_out.items():
+        by_index = sorted((col_indices[col], col, val) for col, val in cols.items())
+        run: List[Tuple[int, str, str]] = []
+        for col_idx, col, val in by_index:
+            if run and col_idx != run[-1][0] + 1:
+                body.append(_row_run_entry(rownum, run))
+                run = []
+            run.append((col_idx, col, val))
+        if run:
+            body.append(_row_run_entry(rownum, run))
+    return body
+
+
+def _row_run_entry(rownum: int, run: List[Tuple[int, str, str]]) -> Dict[str, Any]:
+    start = f"{run[0][1]}{rownum}"
+    end = f"{run[-1][1]}{rownum}"
+    rng = start if len(run) == 1 else f"{start}:{end}"
+    return {"range": rng, "values": [[val for _, _, val in run]]}
+
+
+def write_rows(
+    sh, rows_out: Dict[int, Dict[str, str]], col_indices: Dict[str, int], chunk_size: int = 800
+) -> None:
+    """Write rows via batch_update, about chunk_size cells per call; RAW skips formula parsing."""
+    body = build_batch_update_body(rows_out, col_indices)
+    batch: List[Dict[str, Any]] = []
+    n_cells = 0
+    for entry in body:
+        batch.append(entry)
+        n_cells += len(entry["values"][0])
+        if n_cells >= chunk_size:
+            sh.batch_update(batch, value_input_option="RAW")
+            logger.info("Wrote %d cells.", n_cells)
+            batch, n_cells = [], 0
+    if batch:
+        sh.batch_update(batch, value_input_option="RAW")
+        logger.info("Wrote %d cells.", n_cells)
@@ -0,0 +1,31 @@
+import re
+import unittest
+
+from transcript_text import parse_iso8601_duration
+
+
+class ParseIso8601DurationTest(unittest.TestCase):
+    @staticmethod
+    def _regex_parse(s: str) -> str:
+        # previous implementation, restricted to ASCII digits (durations from the API are ASCII)
+        if not s:
+            return ""
+        m = re.match(r"^PT(?:([0-9]+)H)?(?:([0-9]+)M)?(?:([0-9]+)S)?$", s)
+        if not m:
+            return s
+        return f"{int(m.group(1) or 0):02d}:{int(m.group(2) or 0):02d}:{int(m.group(3) or 0):02d}"
+
+    def test_matches_regex_parser(self):
+        cases = ["", "PT", "PT1H", "PT1H2M3S", "PT15M", "PT45S", "PT10H0S", "PT0S", "PT123M",
+                 "PT1M1H", "PTH", "PT5", "P1DT2H", "PT5X", "PT1H2M3S4", "PT1S2S", "xx"]
+        for s in cases:
+            with self.subTest(s=s):
+                self.assertEqual(parse_iso8601_duration(s), self._regex_parse(s))
+
+    def test_non_ascii_digits_are_not_a_duration(self):
+        self.assertEqual(parse_iso8601_duration("PT१S"), "PT१S")
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import random
+import re
+import unittest
+
+from transcript_text import tidy_punctuation_spacing
+
+
+class TidyPunctuationSpacingTest(unittest.TestCase):
+    @staticmethod
+    def _three_pass(text: str) -> str:
+        text = re.sub(r"\s+([,.;:!?])", r"\1", text)
+        text = re.sub(r"([,.;:!?])([^\s])", r"\1 \2", text)
+        return re.sub(r"\s+", " ", text).strip()
+
+    def test_examples(self):
+        self.assertEqual(tidy_punctuation_spacing(" hello ,world .ok!?  yes "), "hello, world. ok! ? yes")
+
+    def test_matches_three_pass_cleanup(self):
+        rng = random.Random(1)
+        for _ in range(20000):
+            text = "".join(rng.choice("ab .,!?\n\t;") for _ in range(rng.randint(0, 14)))
+            self.assertEqual(tidy_punctuation_spacing(text), self._three_pass(text), repr(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
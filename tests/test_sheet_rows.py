@@ -0,0 +1,86 @@
+import threading
+import time
+import unittest
+
+from sheet_rows import build_batch_update_body, pending_rows, process_rows_parallel, read_sheet_columns, write_rows
+
+COLS = {"B": 2, "C": 3, "E": 5}
+
+
+class FakeSheet:
+    def __init__(self, columns=None):
+        self.columns = columns or {}
+        self.updates = []
+
+    def batch_get(self, ranges):
+        return [[[v] if v else [] for v in self.columns.get(r.split("1:")[0], [])] for r in ranges]
+
+    def batch_update(self, body, value_input_option=None):
+        self.updates.append((list(body), value_input_option))
+
+
+class BuildBatchUpdateBodyTest(unittest.TestCase):
+    def test_adjacent_columns_are_coalesced(self):
+        body = build_batch_update_body({5: {"C": "raw", "B": "clean"}}, COLS)
+        self.assertEqual(body, [{"range": "B5:C5", "values": [["clean", "raw"]]}])
+
+    def test_gap_splits_the_row(self):
+        body = build_batch_update_body({2: {"B": "b", "C": "c", "E": "e"}, 3: {"E": "x"}}, COLS)
+        self.assertEqual(
+            body,
+            [
+                {"range": "B2:C2", "values": [["b", "c"]]},
+                {"range": "E2", "values": [["e"]]},
+                {"range": "E3", "values": [["x"]]},
+            ],
+        )
+
+
+class WriteRowsTest(unittest.TestCase):
+    def test_batches_are_cut_by_cell_count(self):
+        sh = FakeSheet()
+        rows_out = {r: {"B": "b", "C": "c", "E": "e"} for r in range(2, 7)}  # 3 cells, 2 entries per row
+        write_rows(sh, rows_out, COLS, chunk_size=4)
+        cells = [sum(len(e["values"][0]) for e in body) for body, _ in sh.updates]
+        self.assertEqual(cells, [5, 4, 5, 1])
+        self.assertTrue(all(opt == "RAW" for _, opt in sh.updates))
+
+    def test_nothing_to_write(self):
+        sh = FakeSheet()
+        write_rows(sh, {}, COLS)
+        self.assertEqual(sh.updates, [])
+
+
+class ReadSheetColumnsTest(unittest.TestCase):
+    def test_columns_are_padded_to_equal_length(self):
+        sh = FakeSheet({"A": ["url", "u1", "", "u3"], "B": ["clean", "done"]})
+        self.assertEqual(read_sheet_columns(sh, ["A", "B"]), [["url", "u1", "", "u3"], ["clean", "done", "", ""]])
+
+
+class PendingRowsTest(unittest.TestCase):
+    def test_rows_with_url_and_empty_target(self):
+        sh = FakeSheet({"A": ["url", " u1 ", "", "u3", "u4"], "B": ["clean", "", "", "done"]})
+        self.assertEqual(pending_rows(read_sheet_columns(sh, ["A", "B"]), 1), [(2, "u1"), (5, "u4")])
+
+
+class ProcessRowsParallelTest(unittest.TestCase):
+    def test_results_in_row_order_and_failures_skipped(self):
+        def work(rownum, url):
+            time.sleep(0.01 * (5 - rownum % 5))
+            if url == "bad":
+                raise RuntimeError("boom")
+            return url.upper()
+
+        todo = [(9, "x"), (2, "y"), (5, "bad"), (3, "z")]
+        with self.assertLogs("yt_transcript_worker", "WARNING"):
+            out = process_rows_parallel(todo, work, max_workers=4)
+        self.assertEqual(list(out.items()), [(2, "Y"), (3, "Z"), (9, "X")])
+
+    def test_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        out = process_rows_parallel([(1, "a"), (2, "b"), (3, "c")], lambda r, u: barrier.wait() is not None, 3)
+        self.assertEqual(out, {1: True, 2: True, 3: True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import random
+import unittest
+
+from transcript_text import (
+    _RE_VTT_JUNK,
+    _vtt_filter_py,
+    filter_vtt_lines,
+    punct_word_windows,
+    split_with_context,
+    tag_words,
+    trim_context,
+    video_id_from_url,
+)
+
+
+def _byte_scanner(content: str) -> str:
+    # the numba path, run as plain Python
+    buf = bytearray(content.encode("utf-8"))
+    out = bytearray(len(buf))
+    k = _vtt_filter_py(buf, out)
+    return bytes(out[:k]).decode("utf-8", errors="ignore").strip()
+
+
+def _regex(content: str) -> str:
+    return _RE_VTT_JUNK.sub("", content).strip()
+
+
+class VttFilterTest(unittest.TestCase):
+    CASES = [
+        "WEBVTT\nKind: captions\n\n1\n00:00:00.000 --> 00:00:01.000 align:start\nhello wörld\r\n 2 \r\n"
+        "00:00:01.000 --> 00:00:02.000\nfoo 12\n\n3\n",
+        "webvtt x\nabc\n-->",
+        "a\n\n\nb\n12\n",
+        "a->\n-\n--",
+        "\xa012\nkept\n",
+        "१२\nkept\n",
+        " WEBVTT\nkept",
+    ]
+
+    def test_regex_and_byte_scanner_agree(self):
+        for content in self.CASES:
+            with self.subTest(content=content):
+                self.assertEqual(_regex(content), _byte_scanner(content))
+
+    def test_regex_and_byte_scanner_agree_random(self):
+        rng = random.Random(0)
+        alphabet = ["1", "2", " ", "\t", "\r", "\n", "-", ">", "a", "W", "EBVTT", "webvtt", "\xa0", "१", "é"]
+        for _ in range(5000):
+            content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            self.assertEqual(_regex(content), _byte_scanner(content), repr(content))
+
+    def test_non_ascii_digits_and_spaces_are_kept(self):
+        self.assertEqual(filter_vtt_lines("x\n\xa012\n१२\n1\n"), "x\n\xa012\n१२")
+
+    def test_drops_header_cues_and_timestamps(self):
+        self.assertEqual(filter_vtt_lines(self.CASES[0]), "Kind: captions\n\nhello wörld\r\nfoo 12")
+
+
+class PunctuationChunkingTest(unittest.TestCase):
+    def _restore(self, text: str, model) -> str:
+        pieces = split_with_context(text, 350, 10)
+        return " ".join(trim_context(p, model(p), lead, core) for p, lead, core in pieces)
+
+    def test_identity_model_round_trips_words(self):
+        text = " ".join(f"w{i}" for i in range(1000))
+        self.assertEqual(self._restore(text, lambda p: p), text)
+
+    def test_punctuating_model_keeps_one_copy_of_each_word(self):
+        text = " ".join(f"w{i}" for i in range(1000))
+        out = self._restore(text, lambda p: " ".join(w + "," for w in p.split()))
+        self.assertEqual(out.replace(",", ""), text)
+
+    def test_punctuation_only_tokens_are_dropped(self):
+        pieces = split_with_context("a , b . c", 2, 1)
+        self.assertEqual(pieces, [("a b c", 0, 2), ("b c", 1, 1)])
+
+    def test_mismatched_output_is_returned_untrimmed(self):
+        self.assertEqual(trim_context("a b c", "a b", 1, 1), "a b")
+
+
+def _fake_pipe(text: str):
+    # two sub-tokens per word; the label sits on the last one, like the real token classifier
+    entities, pos = [], 0
+    for word in text.split(" "):
+        end = pos + len(word)
+        label = "." if word.endswith("7") else ","
+        entities.append({"entity": "0", "end": pos + len(word) // 2})
+        entities.append({"entity": label, "end": end})
+        pos = end + 1
+    return entities
+
+
+def _library_predict(words, pipe):
+    # deepmultilingualpunctuation 1.0.1 PunctuationModel.predict / overlap_chunks, minus tqdm and scores
+    overlap = 5
+    chunk_size = 230
+    if len(words) <= chunk_size:
+        overlap = 0
+    batches = [words[i : i + chunk_size] for i in range(0, len(words), chunk_size - overlap)]
+    if len(batches[-1]) <= overlap:
+        batches.pop()
+    tagged_words = []
+    for batch in batches:
+        if batch == batches[-1]:
+            overlap = 0
+        text = " ".join(batch)
+        result = pipe(text)
+        assert len(text) == result[-1]["end"], "chunk size too large, text got clipped"
+        char_index = 0
+        result_index = 0
+        for word in batch[: len(batch) - overlap]:
+            char_index += len(word) + 1
+            label = "0"
+            while result_index < len(result) and char_index > result[result_index]["end"]:
+                label = result[result_index]["entity"]
+                result_index += 1
+            tagged_words.append((word, label))
+    return tagged_words
+
+
+class PunctuationWindowTest(unittest.TestCase):
+    def test_matches_library_windowing(self):
+        for n in (1, 229, 230, 231, 451, 455, 456, 1000):
+            words = [f"w{i}" for i in range(n)]
+            ours = []
+            for window, keep in punct_word_windows(words):
+                ours.extend(tag_words(window, keep, _fake_pipe(" ".join(window))))
+            with self.subTest(n=n):
+                self.assertEqual(ours, _library_predict(words, _fake_pipe))
+                self.assertEqual([w for w, _ in ours], words)
+
+    def test_clipped_window_raises(self):
+        window = ["aa", "bb", "cc"]
+        with self.assertRaisesRegex(ValueError, "clipped"):
+            tag_words(window, 3, _fake_pipe("aa bb"))
+        with self.assertRaises(ValueError):
+            tag_words(window, 3, [])
+
+
+class VideoIdFromUrlTest(unittest.TestCase):
+    def test_share_links_map_to_the_same_id(self):
+        urls = [
+            "https://www.youtube.com/watch?v=abcdefghijk",
+            "https://www.youtube.com/watch?v=abcdefghijk&t=30s",
+            "https://youtu.be/abcdefghijk?si=XYZ",
+            "https://youtu.be/abcdefghijk/",
+            "https://www.youtube.com/shorts/abcdefghijk?si=1",
+            "https://www.youtube.com/embed/abcdefghijk#t=5",
+            " abcdefghijk ",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(video_id_from_url(url), "abcdefghijk")
+
+    def test_rejects_anything_but_a_video_id(self):
+        urls = [
+            "https://example.com/*",
+            "https://youtu.be/abc",
+            "https://www.youtube.com/watch?v=abcdefghij[",
+            "https://youtu.be/abcdefghijkl",
+            "",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(video_id_from_url(url), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
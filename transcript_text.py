@@ -0,0 +1,249 @@
+"""
+transcript_text.py
+
+Pure text helpers used by main.py (VTT filtering, punctuation spacing and
+punctuation-model windowing, video ids, ISO8601 durations). No sheet / network / model dependencies, so they can be imported
+and tested on their own.
+"""
+
+import re
+import logging
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger("yt_transcript_worker")
+
+# Optional JIT scanner for very long subtitle files; regex path is used otherwise
+NUMBA_AVAILABLE = False
+try:
+    import numpy as np
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except Exception:
+    logger.info("numba not available; VTT filtering uses regex.")
+
+
+# -------------------------
+# VTT line filter
+# -------------------------
+# whole VTT lines to drop: header, cue numbers, timestamp lines (newline included).
+# ASCII-only so that it drops exactly the lines the byte scanner below drops.
+_RE_VTT_JUNK = re.compile(
+    r"^(?:[^\S\n]*WEBVTT.*|[^\S\n]*\d+[^\S\n]*|.*-->.*)$\n?", re.MULTILINE | re.IGNORECASE | re.ASCII
+)
+# below this many characters the encode/decode round-trip costs more than the regex scan
+_VTT_NUMBA_MIN_CHARS = 64 * 1024
+_WEBVTT_LOWER = (119, 101, 98, 118, 116, 116)  # b"webvtt", as a tuple so numba can freeze it
+
+
+def _vtt_filter_py(buf, out):
+    """
+    Byte-level twin of _RE_VTT_JUNK (which is ASCII-only for that reason): copy lines of
+    buf into out, skipping lines that contain '-->', are only digits, or start with
+    'WEBVTT'. Returns bytes written.
+    """
+    n = len(buf)
+    k = 0
+    start = 0
+    while start < n:
+        end = start
+        while end < n and buf[end] != 10:
+            end += 1
+        # trimmed bounds (space, \t, \n, \v, \f, \r)
+        a = start
+        while a < end and (buf[a] == 32 or 9 <= buf[a] <= 13):
+            a += 1
+        b = end
+        while b > a and (buf[b - 1] == 32 or 9 <= buf[b - 1] <= 13):
+            b -= 1
+        drop = False
+        if b > a:
+            all_digits = True
+            for j in range(a, b):
+                if buf[j] < 48 or buf[j] > 57:
+                    all_digits = False
+                    break
+            drop = all_digits
+        if not drop and b - a >= 6:
+            drop = True
+            for j in range(6):
+                if (buf[a + j] | 32) != _WEBVTT_LOWER[j]:
+                    drop = False
+                    break
+        if not drop:
+            for j in range(start, end - 2):
+                if buf[j] == 45 and buf[j + 1] == 45 and buf[j + 2] == 62:
+                    drop = True
+                    break
+        if not drop:
+            stop = end + 1 if end < n else end
+            for j in range(start, stop):
+                out[k] = buf[j]
+                k += 1
+        start = end + 1
+    return k
+
+
+if NUMBA_AVAILABLE:
+    _vtt_filter_jit = njit(cache=True)(_vtt_filter_py)
+
+    def _vtt_filter(buf: "np.ndarray") -> "np.ndarray":
+        out = np.empty_like(buf)
+        k = _vtt_filter_jit(buf, out)
+        return out[:k]
+
+
+def filter_vtt_lines(content: str) -> str:
+    """Drop WEBVTT header, cue-number and timestamp lines from subtitle content."""
+    if NUMBA_AVAILABLE and len(content) >= _VTT_NUMBA_MIN_CHARS:
+        try:
+            buf = np.frombuffer(content.encode("utf-8"), dtype=np.uint8)
+            return _vtt_filter(buf).tobytes().decode("utf-8", errors="ignore").strip()
+        except Exception as e:
+            logger.debug("numba VTT filter failed, using regex: %s", e)
+    return _RE_VTT_JUNK.sub("", content).strip()
+
+
+# -------------------------
+# Punctuation spacing
+# -------------------------
+# one-pass equivalent of: drop whitespace before punctuation, add a space after
+# punctuation, collapse whitespace (punct, optional ws, punct is what the first step leaves adjacent)
+_RE_TIDY_PUNCT = re.compile(r"([,.;:!?])(?:\s*([,.;:!?])|(\S))|(\s+(?=[,.;:!?]))|\s+")
+
+
+def _tidy_punctuation_repl(m: "re.Match") -> str:
+    punct = m.group(1)
+    if punct is not None:
+        return punct + " " + (m.group(2) or m.group(3))
+    if m.group(4) is not None:
+        return ""
+    return " "
+
+
+def tidy_punctuation_spacing(text: str) -> str:
+    """No space before , . ; : ! ?, one space after, whitespace collapsed."""
+    return _RE_TIDY_PUNCT.sub(_tidy_punctuation_repl, text).strip()
+
+
+# -------------------------
+# Punctuation-model chunking
+# -------------------------
+_PUNCT_MARKS = ",.;:!?"
+# deepmultilingualpunctuation's own word window / stride (see PunctuationModel.predict)
+_PUNCT_WORD_WINDOW = 230
+_PUNCT_WORD_OVERLAP = 5
+
+
+def split_with_context(text: str, max_words: int, context_words: int) -> List[Tuple[str, int, int]]:
+    """
+    Split text into pieces of max_words words, each padded with up to context_words
+    words of context on both sides. Returns (piece, leading context words, core words).
+    Tokens made only of , . ; : ! ? are dropped: the punctuation model strips them
+    anyway, and without them the model emits exactly one word per input word.
+    """
+    words = [w for w in text.split() if w.strip(_PUNCT_MARKS)]
+    n = len(words)
+    pieces = []
+    for s in range(0, n, max_words):
+        lo = max(0, s - context_words)
+        pieces.append((" ".join(words[lo : s + max_words + context_words]), s - lo, min(max_words, n - s)))
+    return pieces
+
+
+def trim_context(piece: str, restored: str, lead: int, core: int) -> str:
+    """
+    Cut the context words back off a restored piece so that joined pieces do not
+    repeat text. If the word count no longer matches the input, restored is returned as-is.
+    """
+    out = restored.split()
+    if len(out) != len(piece.split()):
+        return restored
+    return " ".join(out[lead : lead + core])
+
+
+def punct_word_windows(words: List[str]) -> List[Tuple[List[str], int]]:
+    """Mirror PunctuationModel.predict windowing: (window, number of leading words to keep)."""
+    overlap = _PUNCT_WORD_OVERLAP if len(words) > _PUNCT_WORD_WINDOW else 0
+    windows = [words[i : i + _PUNCT_WORD_WINDOW] for i in range(0, len(words), _PUNCT_WORD_WINDOW - overlap)]
+    if windows and len(windows[-1]) <= overlap:
+        windows.pop()
+    out = [(w, len(w) - overlap) for w in windows]
+    if out:
+        out[-1] = (windows[-1], len(windows[-1]))
+    return out
+
+
+def tag_words(words: List[str], keep: int, entities: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Assign each of the first keep words the label of its last sub-token (same rule
+    as PunctuationModel.predict). Raises ValueError, like the library's assert, if
+    the pipeline's entities do not reach the end of the window text.
+    """
+    if not entities or entities[-1]["end"] != len(" ".join(words)):
+        raise ValueError("chunk size too large, text got clipped")
+    tagged = []
+    char_index = 0
+    result_index = 0
+    for word in words[:keep]:
+        char_index += len(word) + 1
+        label = "0"
+        while result_index < len(entities) and char_index > entities[result_index]["end"]:
+            label = entities[result_index]["entity"]
+            result_index += 1
+        tagged.append((word, label))
+    return tagged
+
+
+# -------------------------
+# YouTube URLs
+# -------------------------
+_RE_URL_TAIL = re.compile(r"[?&#]")
+_RE_VIDEO_ID = re.compile(r"[A-Za-z0-9_-]{11}")
+
+
+def video_id_from_url(video_url: str) -> str:
+    """
+    Video id from watch?v=, youtu.be/, /shorts/ or /embed/ URLs (or a bare id), without query/fragment.
+    Returns "" unless the result is an 11-character YouTube id; the id is used in file globs.
+    """
+    url = video_url.strip()
+    if "watch?v=" in url:
+        vid = _RE_URL_TAIL.split(url.split("watch?v=")[-1], 1)[0]
+    else:
+        vid = _RE_URL_TAIL.split(url, 1)[0].rstrip("/").split("/")[-1]
+    return vid if _RE_VIDEO_ID.fullmatch(vid) else ""
+
+
+# -------------------------
+# ISO8601 durations
+# -------------------------
+_ISO_UNIT_ORDER = {"H": 0, "M": 1, "S": 2}
+
+
+def parse_iso8601_duration(iso_duration: str) -> str:
+    if not iso_duration:
+        return ""
+    if not iso_duration.startswith("PT"):
+        return iso_duration
+    parts = [0, 0, 0]  # hours, minutes, seconds
+    cur = 0
+    has_digits = False
+    last_unit = -1
+    for ch in iso_duration[2:]:
+        if "0" <= ch <= "9":
+            cur = cur * 10 + (ord(ch) - 48)
+            has_digits = True
+            continue
+        unit = _ISO_UNIT_ORDER.get(ch, -1)
+        # unknown designator, missing number or out-of-order unit: not a PT#H#M#S duration
+        if unit <= last_unit or not has_digits:
+            return iso_duration
+        parts[unit] = cur
+        last_unit = unit
+        cur = 0
+        has_digits = False
+    if has_digits:
+        return iso_duration
+    hours, minutes, seconds = parts
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"